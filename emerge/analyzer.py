@@ -7,7 +7,7 @@ Defines 'Analyzer' which brings together the current configuration, analyses, pa
 
 import os
 import logging
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Tuple
 from pathlib import Path
 
 from datetime import datetime
@@ -122,6 +122,9 @@ class Analyzer:
 
         filesystem_graph = analysis.graph_representations[GraphType.FILESYSTEM_GRAPH.name.lower()]
 
+        # collect all files per parser first, so that every parser can process its files as one batch
+        files_by_parser: Dict[str, List[Tuple[str, str, str]]] = {}
+
         project_node: FileSystemNode
         for _, filesystem_node in filesystem_graph.filesystem_nodes.items():
             project_node = filesystem_node
@@ -133,22 +136,17 @@ class Analyzer:
                 parser_name = FileScanMapper.choose_parser(file_extension, analysis.only_permit_languages)
 
                 if parser_name in self._parsers:
-                    parser: AbstractParser = self._parsers[parser_name]
-
                     file_content = project_node.content
 
                     if file_content is None:
                         raise Exception(f'file content is None for file: {project_node.absolute_name}')
-                    
-                    parser.generate_file_result_from_analysis(
-                        analysis,
-                        file_name=file_name,
-                        full_file_path=project_node.absolute_name,
-                        file_content=file_content
-                    )
-                    
-                    results = self._parsers[parser_name].results
-                    analysis.add_results(results)
+
+                    files_by_parser.setdefault(parser_name, []).append((file_name, project_node.absolute_name, file_content))
+
+        for parser_name, files in files_by_parser.items():
+            parser: AbstractParser = self._parsers[parser_name]
+            parser.generate_file_results_from_analysis(analysis, files)
+            analysis.add_results(parser.results)
 
         for parser_name, parser in self._parsers.items():
             if bool(parser.results):
@@ -231,4 +229,4 @@ class Analyzer:
         """
         parser: AbstractParser
         for _, parser in self._parsers.items():
-            parser.results.clear()
+            parser.clear_results()
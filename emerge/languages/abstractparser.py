@@ -6,19 +6,24 @@ Contains all abstract parsing classes and relevant enums.
 # License: MIT
 
 import re
+import os
+import sys
 import logging
+import functools
 
 from abc import ABC, abstractmethod
 from enum import Enum, unique, auto
 from typing import Dict, List, Generator, Optional, Tuple
 from pathlib import Path
-import coloredlogs
+from concurrent.futures import ProcessPoolExecutor
 
 from emerge.abstractresult import AbstractResult, AbstractEntityResult
 from emerge.log import Logger
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
+
+# below this total content size (in characters, about 0.2s of sequential tokenizing), starting worker processes costs more than it saves
+MIN_CONTENT_SIZE_FOR_PARALLEL_PARSING = 4 * 1024 * 1024
 
 
 @unique
@@ -93,8 +98,15 @@ class ParsingMixin(ABC):
     class Constants(Enum):
         MAX_DEBUG_TOKENS_READAHEAD = 10
 
+    # splits content into whitespace separated words, newlines and default separators, which are tokens on their own
+    TOKEN_PATTERN = re.compile(r'[:;{}()\[\]?!,<>]|[^\s:;{}()\[\]?!,<>]+|\n')
+
+    # splits content into whitespace separated words and newlines, after separators were padded by a token mapping
+    MAPPED_TOKEN_PATTERN = re.compile(r'\S+|\n')
+
     @staticmethod
-    def resolve_relative_dependency_path(relative_analysis_dependency_path: str, result_absolute_dir_path: str, analysis_source_directory: str) -> str:
+    def resolve_relative_dependency_path(relative_analysis_dependency_path: str, result_absolute_dir_path: str,
+                                         analysis_source_directory: str) -> str:
         """Creates the absolute path for a dependency and try to resolve it with pathlib."""
 
         resolved_dependency = relative_analysis_dependency_path
@@ -138,9 +150,15 @@ class ParsingMixin(ABC):
             return string.replace(key, value) 
         return string
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def create_parent_analysis_source_path(analysis_source_directory: str) -> str:
+        """Creates the path prefix that is stripped from full file paths, cached as it is the same for all files of an analysis."""
+        return f"{Path(analysis_source_directory).parent}/"
+
     @staticmethod
     def create_relative_analysis_file_path(analysis_source_directory: str, full_file_path: str) -> str:
-        parent_analysis_source_path = f"{Path(analysis_source_directory).parent}/"
+        parent_analysis_source_path = ParsingMixin.create_parent_analysis_source_path(analysis_source_directory)
         relative_file_path_to_analysis = full_file_path.replace(parent_analysis_source_path, "")
         return relative_file_path_to_analysis
 
@@ -233,26 +251,58 @@ class ParsingMixin(ABC):
 
     @classmethod
     def preprocess_file_content_and_generate_token_list(cls, file_content: str) -> List[str]:
-        return re.findall(r'\S+|\n', file_content.replace(':', ' : ')
-                                                 .replace(';', ' ; ')
-                                                 .replace('{', ' { ')
-                                                 .replace('}', ' } ')
-                                                 .replace('(', ' ( ')
-                                                 .replace(')', ' ) ')
-                                                 .replace('[', ' [ ')
-                                                 .replace(']', ' ] ')
-                                                 .replace('?', ' ? ')
-                                                 .replace('!', ' ! ')
-                                                 .replace(',', ' , ')
-                                                 .replace('<', ' < ')
-                                                 .replace('>', ' > ')
-                          )
+        return cls.TOKEN_PATTERN.findall(file_content)
 
     @classmethod
     def preprocess_file_content_and_generate_token_list_by_mapping(cls, file_content: str, mapping_dict: Dict[str, str]) -> List[str]:
+        # str.replace searches and copies in C and outperforms both str.translate with multi character values and a regex alternation
         for origin, mapped in mapping_dict.items():
             file_content = file_content.replace(origin, mapped)
-        return re.findall(r'\S+|\n', file_content)
+
+        # recurring tokens share a single interned string, as the token lists of all file results are kept until the analysis is done
+        intern = sys.intern
+        return [intern(token) for token in cls.MAPPED_TOKEN_PATTERN.findall(file_content)]
+
+
+class WorkerTokenizingMixin(ABC):
+    """Parsers with this mixin tokenize large batches of files in worker processes.
+    See AbstractParser.generate_file_results_from_analysis.
+    """
+
+    @classmethod
+    @abstractmethod
+    def tokenize_file_content(cls, file_content: str) -> List[str]:
+        """Tokenizes and preprocesses the content of a file without a BOM.
+        This runs in worker processes, so it has to be free of side effects.
+        """
+
+    @abstractmethod
+    def add_file_result(self, analysis, *, file_name: str, full_file_path: str, file_content: str, scanned_tokens: List[str],
+                        parent_analysis_source_path: str) -> None:
+        """Creates and stores a file result from the tokens of tokenize_file_content."""
+
+    @abstractmethod
+    def remove_bom(self, input_string: str) -> str:
+        """Removes a byte order mark from the content of a file."""
+
+    def generate_file_results_in_worker_processes(self, analysis, files: List[Tuple[str, str, str]], max_workers: int) -> None:
+        """Tokenizes the file contents in worker processes, while the file results are still created in this process."""
+        LOGGER.debug('generating file results for %d files in parallel...', len(files))
+        file_contents = [self.remove_bom(file_content) for _, _, file_content in files]
+        parent_analysis_source_path = ParsingMixin.create_parent_analysis_source_path(analysis.source_directory)
+        chunksize = max(1, len(files) // (max_workers * 4))
+        intern = sys.intern
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # the bound classmethod is pickled as a reference to its class, so the workers don't need a parser instance
+            scanned_tokens_per_file = executor.map(self.tokenize_file_content, file_contents, chunksize=chunksize)
+
+            for (file_name, full_file_path, _), file_content, scanned_tokens in zip(files, file_contents, scanned_tokens_per_file):
+                # unpickled tokens are only shared within their chunk
+                # intern them again to share them across all files of this process
+                scanned_tokens = [intern(token) for token in scanned_tokens]
+                self.add_file_result(analysis, file_name=file_name, full_file_path=full_file_path, file_content=file_content,
+                                     scanned_tokens=scanned_tokens, parent_analysis_source_path=parent_analysis_source_path)
 
 
 class AbstractParser(ParsingMixin, ABC):
@@ -285,6 +335,23 @@ class AbstractParser(ParsingMixin, ABC):
     def generate_file_result_from_analysis(self, analysis, *, file_name: str, full_file_path: str, file_content: str) -> None:
         ...
 
+    def generate_file_results_from_analysis(self, analysis, files: List[Tuple[str, str, str]]) -> None:
+        """Generates file results for a batch of (file_name, full_file_path, file_content) tuples.
+        Parsers with the WorkerTokenizingMixin tokenize large batches across all CPU cores.
+        """
+        max_workers = os.cpu_count() or 1
+        if isinstance(self, WorkerTokenizingMixin) and max_workers > 1 and \
+                sum(len(file_content) for _, _, file_content in files) >= MIN_CONTENT_SIZE_FOR_PARALLEL_PARSING:
+            WorkerTokenizingMixin.generate_file_results_in_worker_processes(self, analysis, files, max_workers)
+            return
+
+        for file_name, full_file_path, file_content in files:
+            self.generate_file_result_from_analysis(analysis, file_name=file_name, full_file_path=full_file_path, file_content=file_content)
+
+    def clear_results(self) -> None:
+        """Clears all results, parsers that keep additional indexes on their results should clear them as well."""
+        self.results.clear()
+
     @abstractmethod
     def after_generated_file_results(self, analysis) -> None:
         ...
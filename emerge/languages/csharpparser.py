@@ -4,23 +4,35 @@ Contains the implementation of the C# language parser and a relevant keyword enu
 
 # Authors: Henrique Gouveia <hgouveia@icloud.com>
 
-from typing import Dict, List
+from typing import Any, Dict, FrozenSet, List
 from enum import Enum, unique
 import logging
-from pathlib import Path
+import sys
 
-import pyparsing as pp
-import coloredlogs
 import re
 
-from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
+from emerge.languages.abstractparser import AbstractParser, ParsingMixin, WorkerTokenizingMixin, Parser, CoreParsingKeyword, LanguageType
 from emerge.results import FileResult, EntityResult
-from emerge.abstractresult import AbstractResult, AbstractFileResult, AbstractEntityResult
+from emerge.abstractresult import AbstractResult, AbstractEntityResult
 from emerge.stats import Statistics
 from emerge.log import Logger
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
+
+# matches an entity declaration like 'class Foo : Bar' on a space-separated token string
+ENTITY_RE = re.compile(r'(class|struct|interface|enum)\s+([A-Za-z0-9_.]+)(?:\s+:\s+([A-Za-z0-9_.]+))?')
+
+# matches using directives like 'using System.Linq;', but no using statements or aliases
+USING_RE = re.compile(r'^\s*(?:global\s+)?using\s+([A-Za-z0-9_.]+)\s*;', re.MULTILINE)
+
+# cheap check if a source could contain any entity declaration at all
+ENTITY_PROBE_RE = re.compile(r'\b(?:class|struct|interface|enum)\b')
+
+# matches the first keyword of a declaration, which ends the using directives of a file
+DECLARATION_RE = re.compile(r'\b(?:namespace|class|struct|interface|enum)\b')
+
+# matches block scoped and file scoped namespace declarations
+NAMESPACE_RE = re.compile(r'^\s*namespace\s+([A-Za-z_][\w.]*)', re.MULTILINE)
 
 
 @unique
@@ -38,35 +50,35 @@ class CSharpParsingKeyword(Enum):
     STOP_BLOCK_COMMENT = "*/"
 
 
-class CSharpParser(AbstractParser, ParsingMixin):
+# hashed keyword sets, so that every token is checked by a single exact lookup
+ENTITY_KEYWORDS = frozenset({
+    CSharpParsingKeyword.CLASS.value,
+    CSharpParsingKeyword.STRUCT.value,
+    CSharpParsingKeyword.INTERFACE.value,
+    CSharpParsingKeyword.ENUM.value
+})
+
+# only the base of a class or interface is an inheritance, e.g. an enum base is its underlying type
+INHERITING_ENTITY_KEYWORDS = frozenset({
+    CSharpParsingKeyword.CLASS.value,
+    CSharpParsingKeyword.INTERFACE.value
+})
+
+
+class CSharpParser(AbstractParser, ParsingMixin, WorkerTokenizingMixin):
 
     def __init__(self):
         self._results: Dict[str, AbstractResult] = {}
 
-        self._token_mappings: Dict[str, str] = {
-            ':': ' : ',
-            ';': ' ; ',
-            '{': ' { ',
-            '}': ' } ',
-            '(': ' ( ',
-            ')': ' ) ',
-            '[': ' [ ',
-            ']': ' ] ',
-            '?': ' ? ',
-            '!': ' ! ',
-            ',': ' , ',
-            '<': ' < ',
-            '>': ' > ',
-            '"': ' " ',
-            ".": ' . ',
-        }
+        # file results by analysis and unique name, so that later steps don't need to filter all results
+        self._file_results_by_analysis: Dict[Any, Dict[str, FileResult]] = {}
 
         # WORKAROUND: filter out entities that resulted from obvious parsing errors
-        self._ignore_entity_keywords: List[str] = [
+        self._ignore_entity_keywords: FrozenSet[str] = frozenset({
             'class', 'struct', 'interface', 'enum', 'namespace', 'using', 'public', 'private', 'protected',
             'internal', 'static', 'readonly', 'virtual', 'override', 'abstract', 'new', 'this',
             'base', 'event', 'delegate', 'operator', 'implicit', 'explicit'
-        ]
+        })
 
     @classmethod
     def parser_name(cls) -> str:
@@ -84,25 +96,88 @@ class CSharpParser(AbstractParser, ParsingMixin):
     def results(self, value):
         self._results = value
 
-    def preprocess_csharp_source(self, scanned_tokens) -> str:
-        source_string_no_comments = self._filter_source_tokens_without_comments(
-            scanned_tokens,
-            CSharpParsingKeyword.INLINE_COMMENT.value,
-            CSharpParsingKeyword.START_BLOCK_COMMENT.value,
-            CSharpParsingKeyword.STOP_BLOCK_COMMENT.value
-        )
-        filtered_list_no_comments = self.preprocess_file_content_and_generate_token_list_by_mapping(source_string_no_comments, self._token_mappings)
-        preprocessed_source_string = " ".join(filtered_list_no_comments)
-        return preprocessed_source_string
+    def clear_results(self) -> None:
+        super().clear_results()
+        self._file_results_by_analysis.clear()
+
+    @staticmethod
+    def _filter_tokens_without_comments(scanned_tokens: List[str], line_comment_string: str, start_comment_string: str,
+                                        stop_comment_string: str) -> List[str]:
+        """Filters comment lines and empty scopes from a token list in a single pass.
+        This applies the same line based rules as _filter_source_tokens_without_comments, but uses the newline tokens
+        as line boundaries instead of joining, splitting and re-tokenizing the whole source.
+        """
+        newline = CoreParsingKeyword.NEWLINE.value
+        open_scope_character = CSharpParsingKeyword.OPEN_SCOPE.value
+        close_scope_character = CSharpParsingKeyword.CLOSE_SCOPE.value
+
+        filtered_tokens: List[str] = []
+        active_block_comment = False
+        is_first_line = True
+        line_start = 0
+        number_of_tokens = len(scanned_tokens)
+
+        while line_start < number_of_tokens:
+            try:
+                line_end = scanned_tokens.index(newline, line_start)
+            except ValueError:
+                line_end = number_of_tokens
+            line = scanned_tokens[line_start:line_end]
+            line_start = line_end + 1
+
+            # tokens never contain spaces, so a comment marker can only be found within a single token
+            line_string = " ".join(line)
+            if start_comment_string in line_string:
+                active_block_comment = True
+                continue
+            if stop_comment_string in line_string:
+                active_block_comment = False
+                continue
+            if line_string.startswith(line_comment_string):
+                continue
+            if active_block_comment:
+                continue
+
+            if not is_first_line:
+                filtered_tokens.append(newline)
+            is_first_line = False
+
+            if open_scope_character not in line:
+                filtered_tokens.extend(line)
+                continue
+
+            # workaround to bypass scope false positives, drop empty scopes like '{ }'
+            index = 0
+            while index < len(line):
+                if line[index] == open_scope_character and index + 1 < len(line) and line[index + 1] == close_scope_character:
+                    index += 2
+                    continue
+                filtered_tokens.append(line[index])
+                index += 1
+
+        return filtered_tokens
 
     def generate_file_result_from_analysis(self, analysis, *, file_name: str, full_file_path: str, file_content: str) -> None:
         LOGGER.debug('generating file results...')
         file_content = self.remove_bom(file_content)
-        scanned_tokens: List[str] = self.preprocess_file_content_and_generate_token_list(file_content)
+        scanned_tokens: List[str] = self.tokenize_file_content(file_content)
+        parent_analysis_source_path = self.create_parent_analysis_source_path(analysis.source_directory)
+        self.add_file_result(analysis, file_name=file_name, full_file_path=full_file_path, file_content=file_content,
+                             scanned_tokens=scanned_tokens, parent_analysis_source_path=parent_analysis_source_path)
 
+    @classmethod
+    def tokenize_file_content(cls, file_content: str) -> List[str]:
+        """Tokens are interned, so that recurring tokens share a single string object across all files of the calling process.
+        In a worker process this also keeps the pickled token lists small, as pickle writes a shared object only once per chunk.
+        """
+        return [sys.intern(token) for token in cls.preprocess_file_content_and_generate_token_list(file_content)]
+
+    def add_file_result(self, analysis, *, file_name: str, full_file_path: str, file_content: str, scanned_tokens: List[str],
+                        parent_analysis_source_path: str) -> None:
         # make sure to create unique names by using the relative analysis path as a base for the result
-        parent_analysis_source_path = f"{Path(analysis.source_directory).parent}/"
-        relative_file_path_to_analysis = full_file_path.replace(parent_analysis_source_path, "")
+        relative_file_path_to_analysis = full_file_path
+        if full_file_path.startswith(parent_analysis_source_path):
+            relative_file_path_to_analysis = full_file_path[len(parent_analysis_source_path):]
 
         file_result = FileResult.create_file_result(
             analysis=analysis,
@@ -120,6 +195,7 @@ class CSharpParser(AbstractParser, ParsingMixin):
 
         self._add_namespace_to_result(file_result)
         self._results[file_result.unique_name] = file_result
+        self._file_results_by_analysis.setdefault(analysis, {})[file_result.unique_name] = file_result
 
     def after_generated_file_results(self, analysis) -> None:
         self._add_usings_to_file_results(analysis)
@@ -131,158 +207,163 @@ class CSharpParser(AbstractParser, ParsingMixin):
 
     def generate_entity_results_from_analysis(self, analysis):
         LOGGER.debug('generating entity results...')
-        filtered_results: Dict[str, FileResult] = {k: v for (k, v) in self.results.items() \
-            if v.analysis is analysis and isinstance(v, AbstractFileResult)}
+        ignore_entity_keywords = self._ignore_entity_keywords
+        is_entity_in_ignore_list = self.is_entity_in_ignore_list
 
         result: FileResult
-        for _, result in filtered_results.items():
-            scanned_source_code = result.scanned_tokens
-
-            for line in iter(scanned_source_code):
-                if any(keyword in line for keyword in [CSharpParsingKeyword.CLASS.value,
-                                                       CSharpParsingKeyword.STRUCT.value,
-                                                       CSharpParsingKeyword.INTERFACE.value,
-                                                       CSharpParsingKeyword.ENUM.value]):
-
-                    entity_keywords: List[str] = [
-                        CSharpParsingKeyword.CLASS.value,
-                        CSharpParsingKeyword.STRUCT.value,
-                        CSharpParsingKeyword.INTERFACE.value,
-                        CSharpParsingKeyword.ENUM.value
-                    ]
-                    entity_name = pp.Word(pp.alphanums + CoreParsingKeyword.DOT.value + CoreParsingKeyword.UNDERSCORE.value)
-
-                    match_expression = (
-                        pp.Keyword(CSharpParsingKeyword.CLASS.value) |
-                        pp.Keyword(CSharpParsingKeyword.STRUCT.value) |
-                        pp.Keyword(CSharpParsingKeyword.INTERFACE.value) |
-                        pp.Keyword(CSharpParsingKeyword.ENUM.value)) + \
-                        entity_name.setResultsName(CoreParsingKeyword.ENTITY_NAME.value) + \
-                        pp.Optional(pp.Keyword(CoreParsingKeyword.COLON.value)) + pp.SkipTo(
-                        pp.FollowedBy(CSharpParsingKeyword.OPEN_SCOPE.value))
-
-                    comment_keywords: Dict[str, str] = {
-                        CoreParsingKeyword.LINE_COMMENT.value: CSharpParsingKeyword.INLINE_COMMENT.value,
-                        CoreParsingKeyword.START_BLOCK_COMMENT.value: CSharpParsingKeyword.START_BLOCK_COMMENT.value,
-                        CoreParsingKeyword.STOP_BLOCK_COMMENT.value: CSharpParsingKeyword.STOP_BLOCK_COMMENT.value
-                    }
-
-                    entity_results_unfiltered = result.generate_entity_results_from_scopes(entity_keywords, match_expression,
-                                                                                         comment_keywords)
-                    entity_results: List[AbstractEntityResult] = []
-
-                    # WORKAROUND: filter out entities that resulted from obvious parsing errors
-                    filtered_entity_results = [x for x in entity_results_unfiltered if
-                                                not x.entity_name in self._ignore_entity_keywords]
-
-                    # filter even more on the basis of a configured ignore list
-                    for entity_result in filtered_entity_results:
-                        if self.is_entity_in_ignore_list(entity_result.entity_name, analysis):
-                            pass
-                        else:
-                            # add dependencies based on the full file, as the way the entity is parsed, using statements are not included
-                            entity_result_with_dependencies = self._add_usings_to_single_entity_result(entity_result,scanned_source_code,analysis)
-                            entity_results.append(entity_result_with_dependencies)
-
-                    for entity_result in entity_results:
-                        LOGGER.debug(f'{entity_result.entity_name=}')
-                        self._add_inheritance_to_entity_result(entity_result)
-                        self._results[entity_result.entity_name] = entity_result
-
-
-    def _add_inheritance_to_entity_result(self, result: AbstractEntityResult) -> None:
-        LOGGER.debug(f'extracting inheritance from entity result {result.entity_name}...')
-        parent_name = ''
-
-        tokenBefore = ''
-        classOrInterfaceName = ''
-        for current_token, next_token in zip(result.scanned_tokens, result.scanned_tokens[1:] + [""]):
-            if any(keyword in current_token for keyword in [CSharpParsingKeyword.CLASS.value,
-                                                    CSharpParsingKeyword.INTERFACE.value]):
-                classOrInterfaceName = next_token
-                
-            if current_token == CoreParsingKeyword.COLON.value and tokenBefore == classOrInterfaceName:
-                parent_name = next_token
-                break
-            tokenBefore = current_token        
-        if parent_name:
-            result.scanned_inheritance_dependencies.append(parent_name)
-
-    def _add_usings_to_single_entity_result(self,entity_result,scanned_tokens, analysis) -> AbstractEntityResult:
-        """In C#, using statements are scoped to the file level.
-        This method iterates through each entity's scanned tokens
-        to find and add using statements as import dependencies.
+        for result in self._file_results_by_analysis.get(analysis, {}).values():
+            # skip files without any entity keyword, e.g. assembly attributes or generated code
+            if ENTITY_PROBE_RE.search(result.source) is None:
+                continue
+
+            # the using directives are the same for all entities of a file, so scan the source only once
+            usings: List[str] = self._scan_usings_preceding_declarations(result, analysis)
+
+            # WORKAROUND: filter out entities that resulted from obvious parsing errors,
+            # then filter even more on the basis of a configured ignore list
+            # add dependencies based on the full file, as the way the entity is parsed, using statements are not included
+            entity_results: List[AbstractEntityResult] = [
+                self._add_usings_to_single_entity_result(entity_result, usings)
+                for entity_result in self.generate_entity_results_from_scopes(result)
+                if entity_result.entity_name not in ignore_entity_keywords
+                and not is_entity_in_ignore_list(entity_result.entity_name, analysis)
+            ]
+
+            for entity_result in entity_results:
+                LOGGER.debug('entity_result.entity_name=%r', entity_result.entity_name)
+                self._results[entity_result.entity_name] = entity_result
+
+    @staticmethod
+    def collect_scope_tokens(tokens: List[str], index: int) -> List[str]:
+        """Collects the tokens of the scope that opens after the given index, up to the brace that closes it."""
+        open_scope_character: str = CSharpParsingKeyword.OPEN_SCOPE.value
+        close_scope_character: str = CSharpParsingKeyword.CLOSE_SCOPE.value
+        scope_tokens: List[str] = []
+        append_scope_token = scope_tokens.append
+
+        # walk the tokens in place with a single index, instead of copying all following tokens of the file
+        scope_level = 0
+        number_of_tokens = len(tokens)
+        while index < number_of_tokens:
+            token = tokens[index]
+            if token == open_scope_character:
+                scope_level += 1
+
+            if token == close_scope_character:
+                scope_level -= 1
+                if scope_level == 0:
+                    break
+
+            append_scope_token(token)
+            index += 1
+
+        return scope_tokens
+
+    def generate_entity_results_from_scopes(self, result: FileResult) -> List[EntityResult]:
+        """Generate entity results by extracting everything within a scope that begins with an entity keyword.
+        Entity declarations are matched with ENTITY_RE, which also captures a directly inherited parent, e.g. 'class Foo : Bar'.
         """
-        LOGGER.debug('adding usings to entity result...')
+        open_scope_character: str = CSharpParsingKeyword.OPEN_SCOPE.value
+        increment_statistics = result.analysis.statistics.increment
+        parsing_hits, parsing_misses = Statistics.Key.PARSING_HITS, Statistics.Key.PARSING_MISSES
 
-        for _, obj, following in self._gen_word_read_ahead(scanned_tokens):
-            if obj == CSharpParsingKeyword.USING.value:
-                try:
-                    read_ahead_string = self.create_read_ahead_string(obj, following)
-                    import_name = read_ahead_string.split(';')[0].strip()
-                    if self._is_dependency_in_ignore_list(import_name, analysis):
-                        LOGGER.debug(f'ignoring dependency from {entity_result.unique_name} to {import_name}')
-                    else:
-                        entity_result.scanned_import_dependencies.append(import_name.split(' ')[1].strip())
-                        LOGGER.debug(f'adding import: {import_name}')
-                        
-                except Exception as ex:
-                    LOGGER.warning(
-                        f"Error extracting using statement from entity {entity_result.entity_name}: {ex}"
-                    )
-            elif any(keyword in obj for keyword in [CSharpParsingKeyword.NAMESPACE.value,
-                                                    CSharpParsingKeyword.CLASS.value,
-                                                    CSharpParsingKeyword.STRUCT.value,
-                                                    CSharpParsingKeyword.INTERFACE.value,
-                                                    CSharpParsingKeyword.ENUM.value]):
-                break
-        return entity_result
+        found_entities: Dict[str, List[str]] = {}
+        found_parents: Dict[str, str] = {}
+        created_entity_results: List[EntityResult] = []
+
+        filtered_list_no_comments = self._filter_tokens_without_comments(
+            result.scanned_tokens,
+            CSharpParsingKeyword.INLINE_COMMENT.value,
+            CSharpParsingKeyword.START_BLOCK_COMMENT.value,
+            CSharpParsingKeyword.STOP_BLOCK_COMMENT.value
+        )
 
-    def _add_usings_to_entity_results(self, analysis) -> None:
+        for index, obj in enumerate(filtered_list_no_comments):
+            if obj not in ENTITY_KEYWORDS:
+                continue
+
+            # an entity declaration is everything between its keyword and the opening scope
+            entity_match = None
+            try:
+                scope_index = filtered_list_no_comments.index(open_scope_character, index)
+                entity_match = ENTITY_RE.match(" ".join(filtered_list_no_comments[index:scope_index]))
+            except ValueError:
+                pass
+
+            if entity_match is None:
+                increment_statistics(parsing_misses)
+                LOGGER.warning('warning: could not parse result result=%r', result)
+                LOGGER.warning('next tokens: %s',
+                               filtered_list_no_comments[index:index + ParsingMixin.Constants.MAX_DEBUG_TOKENS_READAHEAD.value + 1])
+                continue
+
+            entity_keyword, entity_name, parent_name = entity_match.groups()
+            LOGGER.debug('entity definition found: %s', entity_name)
+            increment_statistics(parsing_hits)
+
+            found_parents.pop(entity_name, None)
+            if parent_name and entity_keyword in INHERITING_ENTITY_KEYWORDS:
+                found_parents[entity_name] = parent_name
+
+            found_entities[entity_name] = self.collect_scope_tokens(filtered_list_no_comments, index)
+
+        for entity_name, tokens in found_entities.items():
+
+            unique_entity_name = result.absolute_name + "/" + entity_name
+            entity_result = EntityResult(
+                analysis=result.analysis,
+                scanned_file_name=result.scanned_file_name,
+                absolute_name=unique_entity_name,
+                display_name=entity_name,
+                scanned_by=result.scanned_by,
+                scanned_language=result.scanned_language,
+                scanned_tokens=tokens,
+                scanned_import_dependencies=[],
+                entity_name=entity_name,
+                module_name=result.module_name,
+                unique_name=entity_name,
+                parent_file_result=result
+            )
+
+            if entity_name in found_parents:
+                entity_result.scanned_inheritance_dependencies.append(found_parents[entity_name])
+
+            created_entity_results.append(entity_result)
+        return created_entity_results
+
+    def _scan_usings_preceding_declarations(self, result: FileResult, analysis) -> List[str]:
+        """Scans all using directives that precede the first declaration in the source of a file, except for ignored dependencies."""
+        source = result.source
+        declaration_match = DECLARATION_RE.search(source)
+        declaration_position = declaration_match.start() if declaration_match is not None else len(source)
+
+        usings: List[str] = []
+        for using_match in USING_RE.finditer(source, 0, declaration_position):
+            import_name = using_match.group(1)
+            if self._is_dependency_in_ignore_list(import_name, analysis):
+                LOGGER.debug('ignoring dependency from %s to %s', result.unique_name, import_name)
+            else:
+                usings.append(import_name)
+        return usings
+
+    def _add_usings_to_single_entity_result(self, entity_result, usings: List[str]) -> AbstractEntityResult:
         """In C#, using statements are scoped to the file level.
-        This method iterates through each entity's scanned tokens
-        to find and add using statements as import dependencies.
+        This method adds the using directives of the entity's file as import dependencies.
         """
-
         LOGGER.debug('adding usings to entity result...')
-        entity_results: Dict[str, AbstractEntityResult] = {
-            k: v for (k, v) in self.results.items()
-            if v.analysis is analysis and isinstance(v, AbstractEntityResult)
-        }
-
-        for _, entity_result in entity_results.items():
-            for _, obj, following in self._gen_word_read_ahead(entity_result.scanned_tokens):
-                if obj == CSharpParsingKeyword.USING.value:
-                    try:
-                        read_ahead_string = self.create_read_ahead_string(obj, following)
-                        import_name = read_ahead_string.split(';')[0].strip()
-                        entity_result.scanned_import_dependencies.append(import_name)
-                    except Exception as ex:
-                        LOGGER.warning(
-                            f"Error extracting using statement from entity {entity_result.entity_name}: {ex}"
-                        )
+        entity_result.scanned_import_dependencies.extend(usings)
+        return entity_result
+
     def _add_usings_to_file_results(self, analysis) -> None:
         LOGGER.debug('adding usings to file results...')
-        namespace_pattern = r'^\s*using\s+[a-zA-Z0-9_.]+$'
-        file_results: Dict[str, FileResult] = {
-            k: v for (k, v) in self.results.items()
-            if v.analysis is analysis and isinstance(v, FileResult)
-        }
-
-        for _, file_result in file_results.items():
-            for _, obj, following in self._gen_word_read_ahead(file_result.scanned_tokens):
-                if obj == CSharpParsingKeyword.USING.value:
-                    try:
-                        read_ahead_string = self.create_read_ahead_string(obj, following)
-                        import_name = read_ahead_string.split(';')[0].strip()
-                        if re.match(namespace_pattern, import_name):
-                            if self._is_dependency_in_ignore_list(import_name, analysis):
-                                LOGGER.debug(f'ignoring dependency from {file_result.unique_name} to {import_name}')
-                            else:
-                                file_result.scanned_import_dependencies.append(import_name.split(' ')[1].strip())
-                                LOGGER.debug(f'adding import: {import_name}')
-                    except Exception as ex:
-                        LOGGER.warning(f"Error extracting using statement from file {file_result.unique_name}: {ex}")
+        for file_result in self._file_results_by_analysis.get(analysis, {}).values():
+            for using_match in USING_RE.finditer(file_result.source):
+                import_name = using_match.group(1)
+                if self._is_dependency_in_ignore_list(import_name, analysis):
+                    LOGGER.debug('ignoring dependency from %s to %s', file_result.unique_name, import_name)
+                else:
+                    file_result.scanned_import_dependencies.append(import_name)
+                    LOGGER.debug('adding import: %s', import_name)
 
     def _add_namespace_to_result(self, result: FileResult):
         """Extracts the namespace from a C# file and adds it to the result.
@@ -290,30 +371,20 @@ class CSharpParser(AbstractParser, ParsingMixin):
         Args:
             result (FileResult): The FileResult object to add the namespace to.
         """
-        LOGGER.debug(f'extracting namespace from file result {result.scanned_file_name}...')
-
-        namespace_keyword = CSharpParsingKeyword.NAMESPACE.value
-        for index, token in enumerate(result.scanned_tokens):
-            if token == namespace_keyword:
-                try:
-                    namespace_parts = []
-                    current_index = index + 1
-                    while result.scanned_tokens[current_index] != CSharpParsingKeyword.OPEN_SCOPE.value:
-                        namespace_parts.append(result.scanned_tokens[current_index])
-                        current_index += 1
-                    result.module_name = ".".join(namespace_parts)
-                    LOGGER.debug(f'added namespace: {result.module_name} to result')
-                    break  # Assuming one namespace declaration per file
-                except IndexError:
-                    LOGGER.warning(
-                        f"Incomplete namespace declaration found in file: {result.scanned_file_name}"
-                    )
-                    break
+        LOGGER.debug('extracting namespace from file result %s...', result.scanned_file_name)
+
+        # assuming one namespace declaration per file
+        namespace_match = NAMESPACE_RE.search(result.source)
+        if namespace_match is not None:
+            result.module_name = namespace_match.group(1)
+            LOGGER.debug('added namespace: %s to result', result.module_name)
+
     def remove_bom(self, input_string: str) -> str:
         # Check if the string starts with the BOM character sequence and remove it
         if input_string.startswith('ï»¿'):
             return input_string[3:]  # Return the string without the BOM
-        return input_string  # Return the original string if no BOM is present  
+        return input_string  # Return the original string if no BOM is present
+
 
 if __name__ == "__main__":
     LEXER = CSharpParser()
@@ -13,7 +13,6 @@ from pathlib import Path
 
 import pyparsing as pp
 
-import coloredlogs
 from emerge.graph import GraphType
 
 from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
@@ -23,7 +22,6 @@ from emerge.log import Logger
 from emerge.stats import Statistics
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
 
 @unique
 class GoParsingKeyword(Enum):
@@ -5,13 +5,12 @@ Contains the implementation of the Groovy language parser and a relevant keyword
 # Authors: Grzegorz Lato <grzegorz.lato@gmail.com>
 # License: MIT
 
-from typing import Dict, List
+from typing import Dict, List, Set
 from enum import Enum, unique
 import logging
 from pathlib import Path
 
 import pyparsing as pp
-import coloredlogs
 
 from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
 from emerge.results import FileResult
@@ -20,7 +19,6 @@ from emerge.log import Logger
 from emerge.stats import Statistics
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
 
 
 @unique
@@ -197,11 +195,15 @@ class GroovyParser(AbstractParser, ParsingMixin):
 
     def _add_imports_to_entity_result(self, entity_result: AbstractEntityResult):
         LOGGER.debug('adding imports to entity result...')
+        added_imports: Set[str] = set(entity_result.scanned_import_dependencies)
         for scanned_import in entity_result.parent_file_result.scanned_import_dependencies:
+            if scanned_import in added_imports:
+                continue
             last_component_of_import = scanned_import.split(CoreParsingKeyword.DOT.value)[-1]
-            for token in entity_result.scanned_tokens:  # either check for substrings in token, or find a better way to tokenize
-                if last_component_of_import in token and scanned_import not in entity_result.scanned_import_dependencies:
-                    entity_result.scanned_import_dependencies.append(scanned_import)
+            # either check for substrings in token, or find a better way to tokenize
+            if any(last_component_of_import in token for token in entity_result.scanned_tokens):
+                entity_result.scanned_import_dependencies.append(scanned_import)
+                added_imports.add(scanned_import)
 
     def _add_package_name_to_result(self, result: FileResult):
         LOGGER.debug(f'extracting package name from base result {result.scanned_file_name}...')
@@ -12,7 +12,6 @@ from pathlib import Path
 import os
 
 import pyparsing as pp
-import coloredlogs
 
 from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
 from emerge.results import FileResult
@@ -21,7 +20,6 @@ from emerge.stats import Statistics
 from emerge.log import Logger
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
 
 
 @unique
@@ -16,7 +16,6 @@ import sys
 import pkg_resources
 from pip._internal.operations.freeze import freeze
 
-import coloredlogs
 import pyparsing as pp
 
 from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
@@ -26,7 +25,6 @@ from emerge.log import Logger
 from emerge.stats import Statistics
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
 
 
 @unique
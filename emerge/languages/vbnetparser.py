@@ -1,21 +1,20 @@
 from enum import Enum, unique
-from typing import Dict, List
+from typing import Any, ClassVar, Dict, FrozenSet, List, Set
 import re
 import logging
-from pathlib import Path
 
 import pyparsing as pp
-import coloredlogs
-import re
 
-from emerge.languages.abstractparser import AbstractParser, ParsingMixin, Parser, CoreParsingKeyword, LanguageType
+from emerge.languages.abstractparser import AbstractParser, ParsingMixin, WorkerTokenizingMixin, Parser, CoreParsingKeyword, LanguageType
 from emerge.results import FileResult, EntityResult
-from emerge.abstractresult import AbstractResult, AbstractFileResult, AbstractEntityResult
+from emerge.abstractresult import AbstractResult, AbstractEntityResult
 from emerge.stats import Statistics
 from emerge.log import Logger
 
 LOGGER = Logger(logging.getLogger('parser'))
-coloredlogs.install(level='E', logger=LOGGER.logger(), fmt=Logger.log_format)
+
+# cheap check if a source could contain any entity declaration at all
+ENTITY_PROBE_RE = re.compile(r'\b(?:Class|Structure|Interface|Enum)\b')
 
 
 class VBNetParsingKeyword(Enum):
@@ -35,33 +34,67 @@ class VBNetParsingKeyword(Enum):
     REGION = "Region"
     INHERITANCE = "Inherits"
 
-class VBNetParser (AbstractParser, ParsingMixin):
+
+# keywords that start an entity declaration
+ENTITY_KEYWORDS: FrozenSet[str] = frozenset({
+    VBNetParsingKeyword.CLASS.value,
+    VBNetParsingKeyword.STRUCT.value,
+    VBNetParsingKeyword.INTERFACE.value,
+    VBNetParsingKeyword.ENUM.value
+})
+
+# matches entity declarations, built once as constructing pyparsing elements is expensive
+# packrat is not enabled, since parse_string resets the packrat cache on every call and each read ahead is parsed once
+ENTITY_EXPRESSION = (pp.Keyword(VBNetParsingKeyword.CLASS.value) |
+                     pp.Keyword(VBNetParsingKeyword.STRUCT.value) |
+                     pp.Keyword(VBNetParsingKeyword.INTERFACE.value) |
+                     pp.Keyword(VBNetParsingKeyword.ENUM.value)) + \
+    pp.Word(pp.alphanums + '_').setResultsName('entity_name')
+
+# keywords that open a scope which is closed by 'End <keyword>', matched exactly so that e.g. 'Enumerable' or 'Subtotal' don't open scopes
+SCOPE_OPENING_KEYWORDS: FrozenSet[str] = frozenset({
+    VBNetParsingKeyword.NAMESPACE.value,
+    VBNetParsingKeyword.CLASS.value,
+    VBNetParsingKeyword.STRUCT.value,
+    VBNetParsingKeyword.INTERFACE.value,
+    VBNetParsingKeyword.ENUM.value,
+    VBNetParsingKeyword.FUNCTION.value,
+    VBNetParsingKeyword.SUB.value,
+    VBNetParsingKeyword.IF.value
+})
+
+
+class VBNetParser (AbstractParser, ParsingMixin, WorkerTokenizingMixin):
+
+    # immutable, so it is shared by all instances instead of being rebuilt in __init__
+    _token_mappings: ClassVar[Dict[str, str]] = {
+        ':': ' : ',
+        ';': ' ; ',
+        '(': ' ( ',
+        ')': ' ) ',
+        '{': ' { ',
+        '}': ' } ',
+        '[': ' [ ',
+        ']': ' ] ',
+        '?': ' ? ',
+        '!': ' ! ',
+        ',': ' , ',
+        '<': ' < ',
+        '>': ' > ',
+        '"': ' " ',
+    }
+
     def __init__(self):
         self._results: Dict[str, AbstractResult] = {}
-        
-        self._token_mappings: Dict[str, str] = {
-            ':': ' : ',
-            ';': ' ; ',
-            '(': ' ( ',
-            ')': ' ) ',
-            '{': ' { ',
-            '}': ' } ',
-            '[': ' [ ',
-            ']': ' ] ',
-            '?': ' ? ',
-            '!': ' ! ',
-            ',': ' , ',
-            '<': ' < ',
-            '>': ' > ',
-            '"': ' " ',
-
-        }
-
-        self._ignore_entity_keywords: List[str] = [
+
+        # file results by analysis and unique name, so that later steps don't need to filter all results
+        self._file_results_by_analysis: Dict[Any, Dict[str, FileResult]] = {}
+
+        self._ignore_entity_keywords: FrozenSet[str] = frozenset({
             'Class', 'Structure', 'Interface', 'Enum', 'Namespace', 'Imports', 'Public', 'Private', 'Protected',
             'Friend', 'Static', 'ReadOnly', 'Overridable', 'MustOverride', 'NotOverridable', 'Shadows', 'New', 'Me',
             'MyBase', 'Event', 'Delegate', 'Operator', 'Implicit', 'Explicit'
-        ]
+        })
 
     @classmethod
     def parser_name(cls) -> str:
@@ -79,53 +112,92 @@ class VBNetParser (AbstractParser, ParsingMixin):
     def results(self, value):
         self._results = value
 
+    def clear_results(self) -> None:
+        super().clear_results()
+        self._file_results_by_analysis.clear()
+
     def remove_bom(self, input_string: str) -> str:
-        # Check if the string starts with the BOM character sequence and remove it
+        # Check if the string starts with the BOM code point, or with its UTF-8 bytes read as ISO-8859-1, and remove it
+        if input_string.startswith('\ufeff'):
+            return input_string[1:]
         if input_string.startswith('ï»¿'):
-            return input_string[3:]  # Return the string without the BOM
+            return input_string[3:]
         return input_string  # Return the original string if no BOM is present  
 
-    def preprocess_vbnet_source(self, scanned_tokens) -> List[str]:
-        # Filter out #Region and #End Region tokens along with their names
-        filtered_tokens = []
+    @staticmethod
+    def _find_token_indexes(tokens: List[str], token: str) -> List[int]:
+        """Finds all indexes of a token, each list.index call scans in C up to the next occurrence."""
+        indexes: List[int] = []
+        try:
+            index = tokens.index(token)
+            while True:
+                indexes.append(index)
+                index = tokens.index(token, index + 1)
+        except ValueError:
+            return indexes
+
+    @staticmethod
+    def _remove_token_indexes(tokens: List[str], indexes: Set[int]) -> List[str]:
+        """Copies the tokens between the given indexes as slices, the tokens are returned as they are if there is nothing to remove."""
+        if not indexes:
+            return tokens
+
+        remaining_tokens: List[str] = []
+        slice_start = 0
+        for index in sorted(indexes):
+            remaining_tokens.extend(tokens[slice_start:index])
+            slice_start = index + 1
+        remaining_tokens.extend(tokens[slice_start:])
+        return remaining_tokens
 
+    @classmethod
+    def preprocess_vbnet_source(cls, scanned_tokens) -> List[str]:
+        # Filter out #Region and #End Region tokens along with their names
         region_start_block = "#"+VBNetParsingKeyword.REGION.value
-        region_end_block= "#"+VBNetParsingKeyword.CLOSE_SCOPE.value + " " + VBNetParsingKeyword.REGION.value
-
-        token_before = ''
-        
-        for current_token, next_token in zip(scanned_tokens, scanned_tokens[1:] + [""]):
-            valid_token = True
-
-            if(current_token == region_start_block):
-                valid_token = False
-            if(token_before == region_start_block and current_token.strip().startswith('"')):
-                valid_token = False
-            if((current_token + " " + next_token) == region_end_block ):
-                valid_token = False
-            if (valid_token):
-                filtered_tokens.append(current_token)
-            token_before = current_token
-
-        source_string_no_comments = self._filter_source_tokens_without_comments(
+        region_end_block = "#"+VBNetParsingKeyword.CLOSE_SCOPE.value
+        number_of_tokens = len(scanned_tokens)
+
+        # region directives are rare, so find them by scanning in C instead of checking every token in python
+        excluded_indexes: Set[int] = set()
+        for index in cls._find_token_indexes(scanned_tokens, region_start_block):
+            excluded_indexes.add(index)
+            if index + 1 < number_of_tokens and scanned_tokens[index + 1].startswith('"'):
+                excluded_indexes.add(index + 1)
+        for index in cls._find_token_indexes(scanned_tokens, region_end_block):
+            if index + 1 < number_of_tokens and scanned_tokens[index + 1] == VBNetParsingKeyword.REGION.value:
+                excluded_indexes.add(index)
+
+        filtered_tokens: List[str] = cls._remove_token_indexes(scanned_tokens, excluded_indexes)
+
+        source_string_no_comments = cls._filter_source_tokens_without_comments(
             filtered_tokens,
             VBNetParsingKeyword.INLINE_COMMENT.value,
             VBNetParsingKeyword.START_BLOCK_COMMENT.value,
             VBNetParsingKeyword.STOP_BLOCK_COMMENT.value
         )
-        filtered_list_no_comments = self.preprocess_file_content_and_generate_token_list_by_mapping(source_string_no_comments, self._token_mappings)
+        filtered_list_no_comments = cls.preprocess_file_content_and_generate_token_list_by_mapping(source_string_no_comments,
+                                                                                                   cls._token_mappings)
 
         return filtered_list_no_comments
 
     def generate_file_result_from_analysis(self, analysis, *, file_name: str, full_file_path: str, file_content: str) -> None:
-
         file_content = self.remove_bom(file_content)
-        scanned_tokens: List[str] = self.preprocess_file_content_and_generate_token_list(file_content)
-        
-        scanned_tokens = self.preprocess_vbnet_source(scanned_tokens)
-        
-        parent_analysis_source_path = f"{Path(analysis.source_directory).parent}/"
-        relative_file_path_to_analysis = full_file_path.replace(parent_analysis_source_path, "")
+        scanned_tokens: List[str] = self.tokenize_file_content(file_content)
+        parent_analysis_source_path = self.create_parent_analysis_source_path(analysis.source_directory)
+        self.add_file_result(analysis, file_name=file_name, full_file_path=full_file_path, file_content=file_content,
+                             scanned_tokens=scanned_tokens, parent_analysis_source_path=parent_analysis_source_path)
+
+    @classmethod
+    def tokenize_file_content(cls, file_content: str) -> List[str]:
+        """Tokenizes the content and removes regions and comments, the mapping tokenizer already interns all tokens."""
+        return cls.preprocess_vbnet_source(cls.preprocess_file_content_and_generate_token_list(file_content))
+
+    def add_file_result(self, analysis, *, file_name: str, full_file_path: str, file_content: str, scanned_tokens: List[str],
+                        parent_analysis_source_path: str) -> None:
+        # only strip the leading parent path, a replace would also remove any later occurrence of it
+        relative_file_path_to_analysis = full_file_path
+        if full_file_path.startswith(parent_analysis_source_path):
+            relative_file_path_to_analysis = full_file_path[len(parent_analysis_source_path):]
 
         file_result = FileResult.create_file_result(
             analysis=analysis,
@@ -142,46 +214,26 @@ class VBNetParser (AbstractParser, ParsingMixin):
         )
 
         self._results[file_result.unique_name] = file_result
+        self._file_results_by_analysis.setdefault(analysis, {})[file_result.unique_name] = file_result
 
     def generate_entity_results_from_analysis(self, analysis) -> None:
-        logging.debug('Generating entity results...')
-        filtered_results: Dict[str, FileResult] = {k: v for (k, v) in self.results.items() if isinstance(v, AbstractFileResult)}
+        LOGGER.debug('generating entity results...')
 
-        for result in filtered_results.values():
-            scanned_source_code = result.scanned_tokens
+        for result in self._file_results_by_analysis.get(analysis, {}).values():
+            # skip files without any entity keyword before walking all tokens
+            if ENTITY_PROBE_RE.search(result.source) is None:
+                continue
 
-            # Define keywords and match expression for entity identification
-            entity_keywords: List[str] = [
-                VBNetParsingKeyword.CLASS.value,
-                VBNetParsingKeyword.STRUCT.value,
-                VBNetParsingKeyword.INTERFACE.value,
-                VBNetParsingKeyword.ENUM.value
-            ]
-
-             # Define ParseElements for matching entity declarations
-            entity_name = pp.Word(pp.alphanums + '_')
-            match_expression = (pp.Keyword(VBNetParsingKeyword.CLASS.value) |
-                                pp.Keyword(VBNetParsingKeyword.STRUCT.value) |
-                                pp.Keyword(VBNetParsingKeyword.INTERFACE.value) |
-                                pp.Keyword(VBNetParsingKeyword.ENUM.value)) + \
-                               entity_name.setResultsName('entity_name')
-
-            
-            # Define comment keywords for filtering comments
-            comment_keywords: Dict[str, str] = {
-                'line_comment': VBNetParsingKeyword.INLINE_COMMENT.value,
-                'start_block_comment': VBNetParsingKeyword.START_BLOCK_COMMENT.value,
-                'stop_block_comment': VBNetParsingKeyword.STOP_BLOCK_COMMENT.value
-            }
+            scanned_source_code = result.scanned_tokens
 
             # Use the helper method to generate entity results from scopes
-            entity_results_unfiltered = self.generate_entity_results_from_scopes(result,entity_keywords, match_expression, comment_keywords)
+            entity_results_unfiltered = self.generate_entity_results_from_scopes(result, ENTITY_KEYWORDS, ENTITY_EXPRESSION)
 
             # Filter out entities that resulted from obvious parsing errors
             entity_results: List[AbstractEntityResult] = []
             for entity_result in entity_results_unfiltered:
                 if entity_result.entity_name not in self._ignore_entity_keywords:
-                    logging.debug(f'Valid entity found: {entity_result.entity_name}')
+                    LOGGER.debug('valid entity found: %s', entity_result.entity_name)
                     self._add_imports_to_single_entity_result(entity_result, scanned_source_code, analysis)
                     entity_results.append(entity_result)
 
@@ -195,36 +247,45 @@ class VBNetParser (AbstractParser, ParsingMixin):
         This method iterates through each entity's scanned tokens
         to find and add Imports statements as import dependencies.
         """
-        logging.debug('Adding Imports to entity result...')
-
-        for _, obj, following in self._gen_word_read_ahead(scanned_tokens):
-            if obj == VBNetParsingKeyword.IMPORT.value:
-                try:
-                    read_ahead_string = self.create_read_ahead_string(obj, following)
-                    import_name = read_ahead_string.split('\n')[0].strip()
-                    entity_result.scanned_import_dependencies.append(import_name.split(' ')[1].strip())
-                    logging.debug(f'Adding import: {import_name}')
-                except Exception as ex:
-                    logging.warning(f"Error extracting Imports statement from entity {entity_result.entity_name}: {ex}")
-            elif any(keyword in obj for keyword in [VBNetParsingKeyword.NAMESPACE.value,
-                                                    VBNetParsingKeyword.CLASS.value,
-                                                    VBNetParsingKeyword.STRUCT.value,
-                                                    VBNetParsingKeyword.INTERFACE.value,
-                                                    VBNetParsingKeyword.ENUM.value]):
+        LOGGER.debug('adding imports to entity result...')
+
+        import_keyword: str = VBNetParsingKeyword.IMPORT.value
+
+        # the membership test runs in C, so files without any Imports statement never enter the read ahead loop
+        if import_keyword not in scanned_tokens:
+            return
+
+        newline: str = CoreParsingKeyword.NEWLINE.value
+        last_index = len(scanned_tokens) - 1
+        added_imports: Set[str] = set(entity_result.scanned_import_dependencies)
+
+        for index, obj in enumerate(scanned_tokens):
+            if obj == import_keyword:
+                # the imported namespace is exactly the token following the keyword on the same line
+                if index < last_index and scanned_tokens[index + 1] != newline:
+                    import_name = scanned_tokens[index + 1]
+                    if import_name not in added_imports:
+                        entity_result.scanned_import_dependencies.append(import_name)
+                        added_imports.add(import_name)
+                        LOGGER.debug('adding import: %s', import_name)
+                else:
+                    LOGGER.warning('error extracting imports statement from entity %s: missing import name', entity_result.entity_name)
+            elif obj in SCOPE_OPENING_KEYWORDS:
+                # Imports statements precede all declarations
                 break
     def _add_inheritance_to_entity_result(self, result: AbstractEntityResult) -> None:
-        LOGGER.debug(f'extracting inheritance from entity result {result.entity_name}...')
+        LOGGER.debug('extracting inheritance from entity result %s...', result.entity_name)
         parent_name = ''
-        classOrInterfaceName = ''
-        for current_token, next_token in zip(result.scanned_tokens, result.scanned_tokens[1:] + [""]):
-            if any(keyword in current_token for keyword in [VBNetParsingKeyword.CLASS.value,
-                                                    VBNetParsingKeyword.INTERFACE.value]):
-                classOrInterfaceName = next_token
-                
-            if current_token == VBNetParsingKeyword.INHERITANCE.value and classOrInterfaceName != '':
-                parent_name = next_token
-                classOrInterfaceName = ''
-                break
+
+        # only classes and interfaces can inherit, the entity tokens always start with their keyword
+        scanned_tokens = result.scanned_tokens
+        if scanned_tokens and scanned_tokens[0] in (VBNetParsingKeyword.CLASS.value, VBNetParsingKeyword.INTERFACE.value):
+            try:
+                inheritance_index = scanned_tokens.index(VBNetParsingKeyword.INHERITANCE.value)
+                if inheritance_index + 1 < len(scanned_tokens):
+                    parent_name = scanned_tokens[inheritance_index + 1]
+            except ValueError:
+                pass
 
         if parent_name:
             result.scanned_inheritance_dependencies.append(parent_name)
@@ -236,144 +297,153 @@ class VBNetParser (AbstractParser, ParsingMixin):
     def create_unique_entity_name(self, entity: AbstractEntityResult) -> None:
         return entity.entity_name
 
-    def _filter_source_tokens_without_comments(self, list_of_words, line_comment_string, start_comment_string, stop_comment_string) -> str:
-        source = " ".join(list_of_words)
-        source_lines = source.splitlines()
-        source_lines_without_comments = []
-        active_block_comment = False
+    @staticmethod
+    def _filter_source_tokens_without_comments(list_of_words, line_comment_string, start_comment_string, stop_comment_string) -> str:
+        """Filters comment and region lines by walking the lines of the token list between its newline tokens,
+        instead of joining all tokens to a single source string and splitting it into lines again.
+        Tokens never contain whitespace, so a line starts with a comment string exactly if its first token does.
+        """
+        newline = CoreParsingKeyword.NEWLINE.value
+        region_start_block = "#" + VBNetParsingKeyword.REGION.value
+        region_end_block = "#" + VBNetParsingKeyword.CLOSE_SCOPE.value
 
+        words_without_comments: List[str] = []
+        active_block_comment = False
+        line_start = 0
+        number_of_words = len(list_of_words)
+
+        # like str.splitlines(), a trailing newline does not start another line
+        while line_start < number_of_words:
+            try:
+                line_end = list_of_words.index(newline, line_start)
+            except ValueError:
+                line_end = number_of_words
+            first_word = list_of_words[line_start] if line_start < line_end else ''
+            second_word = list_of_words[line_start + 1] if line_start + 1 < line_end else ''
 
-        for line in source_lines:
             # Skip lines containing #Region (with name) and #End Region
-            if line.strip().startswith('#Region') or line.strip().startswith('#End Region'):
-                continue
-                
-            if line.strip().startswith(start_comment_string):
+            if first_word.startswith(region_start_block) or \
+                    (first_word == region_end_block and second_word.startswith(VBNetParsingKeyword.REGION.value)):
+                pass
+            elif first_word.startswith(start_comment_string):
                 active_block_comment = True
-                continue
-            if line.strip().startswith(stop_comment_string):
+            elif first_word.startswith(stop_comment_string):
                 active_block_comment = False
-                continue
-            if line.strip().startswith(line_comment_string):
-                continue
+            elif not first_word.startswith(line_comment_string) and not active_block_comment:
+                words_without_comments.extend(list_of_words[line_start:line_end])
+                words_without_comments.append(newline)
 
-            if not active_block_comment:
-                source_lines_without_comments.append(line)
+            line_start = line_end + 1
 
-        return "\n".join(source_lines_without_comments)
+        # drop the newline after the last line
+        if words_without_comments:
+            words_without_comments.pop()
+        return " ".join(words_without_comments)
 
-    def preprocess_file_content_and_generate_token_list_by_mapping(self, file_content, mapping_dict):
-        for origin, mapped in mapping_dict.items():
-            file_content = file_content.replace(origin, mapped)
-        return re.findall(r'\S+|\n', file_content)
+    def _add_imports_to_file_results(self, analysis) -> None:
+        import_keyword: str = VBNetParsingKeyword.IMPORT.value
+        newline: str = CoreParsingKeyword.NEWLINE.value
 
+        for file_result in self._file_results_by_analysis.get(analysis, {}).values():
+            if import_keyword not in file_result.source:
+                continue
 
-    def _add_imports_to_file_results(self, analysis) -> None:
-        file_results: Dict[str, FileResult] = {
-            k: v for (k, v) in self.results.items()
-            if v.analysis is analysis and isinstance(v, FileResult)
-        }
-
-        for _, file_result in file_results.items():
-            for _, obj, following in self._gen_word_read_ahead(file_result.scanned_tokens):
-                if obj == VBNetParsingKeyword.IMPORT.value:
-                    try:
-                        read_ahead_string = self.create_read_ahead_string(obj, following)
-                        import_name = read_ahead_string.split('\n')[0].strip()
-                        file_result.scanned_import_dependencies.append(import_name.split(' ')[1].strip())
-                    except Exception as ex:
-                        logging.warning(f"Error extracting import statement from entity {file_result.display_name}: {ex}")
+            scanned_tokens = file_result.scanned_tokens
+            last_index = len(scanned_tokens) - 1
+            added_imports: Set[str] = set(file_result.scanned_import_dependencies)
 
-    @staticmethod
-    def _gen_word_read_ahead(list_of_words):
-        following = None
-        length = len(list_of_words)
-        for index, obj in enumerate(list_of_words):
-            if index < (length - 1):
-                following = list_of_words[index + 1:]
-            yield index, obj, following
+            for index, obj in enumerate(scanned_tokens):
+                if obj == import_keyword:
+                    if index < last_index and scanned_tokens[index + 1] != newline:
+                        import_name = scanned_tokens[index + 1]
+                        if import_name not in added_imports:
+                            file_result.scanned_import_dependencies.append(import_name)
+                            added_imports.add(import_name)
+                    else:
+                        LOGGER.warning('error extracting import statement from file %s: missing import name', file_result.display_name)
 
     @staticmethod
-    def create_read_ahead_string(obj, following):
-        read_ahead = [obj]
-        read_ahead += following
-        return " ".join(read_ahead)
+    def create_entity_read_ahead_string(tokens: List[str], index: int) -> str:
+        """Joins the tokens from the given index up to the next token that is not a newline.
+        This is all that ENTITY_EXPRESSION consumes.
+        """
+        newline = CoreParsingKeyword.NEWLINE.value
+        next_index = index + 1
+        while next_index < len(tokens) and tokens[next_index] == newline:
+            next_index += 1
+        return " ".join(tokens[index:next_index + 1])
     
-    def generate_entity_results_from_scopes(self, result, entity_keywords, entity_expression, comment_keywords) -> List[EntityResult]:
+    @staticmethod
+    def collect_scope_tokens(tokens: List[str], index: int) -> List[str]:
+        """Collects the tokens of the scope that opens at the given index, up to the token that closes it."""
+        close_scope_keyword: str = VBNetParsingKeyword.CLOSE_SCOPE.value
+        scope_opening_keywords = SCOPE_OPENING_KEYWORDS
+        scope_tokens: List[str] = []
+        append_scope_token = scope_tokens.append
+
+        # walk the tokens in place with a single index, instead of copying all following tokens of the file
+        scope_level = 0
+        number_of_tokens = len(tokens)
+        while index < number_of_tokens:
+            token = tokens[index]
+            next_token = tokens[index + 1] if index + 1 < number_of_tokens else ""
+            if token in scope_opening_keywords:
+                scope_level += 1
+
+            if token == close_scope_keyword and next_token in scope_opening_keywords:
+                scope_level -= 1
+                if scope_level == 0:
+                    break
+                index += 2
+
+            append_scope_token(token)
+            index += 1
+
+        return scope_tokens
+
+    def generate_entity_results_from_scopes(self, result, entity_keywords, entity_expression) -> List[EntityResult]:
         """Generate entity results by extracting everything within a scope that begins with an entity keyword."""
         close_scope_character: str = VBNetParsingKeyword.CLOSE_SCOPE.value
-
-        line_comment_keyword: str = comment_keywords[CoreParsingKeyword.LINE_COMMENT.value]
-        start_block_comment_keyword: str = comment_keywords[CoreParsingKeyword.START_BLOCK_COMMENT.value]
-        stop_block_comment_keyword: str = comment_keywords[CoreParsingKeyword.STOP_BLOCK_COMMENT.value]
+        increment_statistics = result.analysis.statistics.increment
+        parsing_hits, parsing_misses = Statistics.Key.PARSING_HITS, Statistics.Key.PARSING_MISSES
 
         found_entities: Dict[str, List[str]] = {}
         created_entity_results: List[EntityResult] = []
 
-        list_of_words_with_newline_strings = result.scanned_tokens
-        source_string_no_comments = self._filter_source_tokens_without_comments(
-            list_of_words_with_newline_strings, line_comment_keyword, start_block_comment_keyword, stop_block_comment_keyword)
+        # the scanned tokens are already free of comments, so use them directly instead of joining and tokenizing them again,
+        # only the trailing newline is dropped, like joining the lines of the source did
+        scanned_tokens: List[str] = result.scanned_tokens
+        if scanned_tokens and scanned_tokens[-1] == CoreParsingKeyword.NEWLINE.value:
+            scanned_tokens = scanned_tokens[:-1]
 
-        # workaround to bypass scope false positives
-        source_string_no_comments = source_string_no_comments.replace("{}", "")
-        source_string_no_comments = source_string_no_comments.replace("{ }", "")
+        # workaround to bypass scope false positives, drop empty '{ }' pairs
+        empty_scope_indexes: Set[int] = set()
+        for index in self._find_token_indexes(scanned_tokens, '{'):
+            if index + 1 < len(scanned_tokens) and scanned_tokens[index + 1] == '}':
+                empty_scope_indexes.update((index, index + 1))
 
-        filtered_list_no_comments = self.preprocess_file_content_and_generate_token_list(source_string_no_comments)
+        filtered_list_no_comments = self._remove_token_indexes(scanned_tokens, empty_scope_indexes)
 
         previous_obj = ''
-        for _, obj, following in self._gen_word_read_ahead(filtered_list_no_comments):
+        for index, obj in enumerate(filtered_list_no_comments):
             if obj in entity_keywords and previous_obj != close_scope_character:
-                read_ahead_string = self.create_read_ahead_string(obj, following)
+                read_ahead_string = self.create_entity_read_ahead_string(filtered_list_no_comments, index)
 
                 try:
                     parsing_result = entity_expression.parseString(read_ahead_string)
                 except pp.ParseException:
-                    result.analysis.statistics.increment(Statistics.Key.PARSING_MISSES)
-                    LOGGER.warning(f'warning: could not parse result {result=}')
-                    LOGGER.warning(f'next tokens: {[obj] + following[:ParsingMixin.Constants.MAX_DEBUG_TOKENS_READAHEAD.value]}')
+                    increment_statistics(parsing_misses)
+                    LOGGER.warning('warning: could not parse result result=%r', result)
+                    LOGGER.warning('next tokens: %s',
+                                   filtered_list_no_comments[index:index + ParsingMixin.Constants.MAX_DEBUG_TOKENS_READAHEAD.value + 1])
                     continue
 
-                LOGGER.debug(f'entity definition found: {parsing_result.entity_name}')
-                result.analysis.statistics.increment(Statistics.Key.PARSING_HITS)
-
-                scope_level = 0
-                found_entities[parsing_result.entity_name] = []
-                all_tokens = [obj] + following
-                following_tokens = all_tokens[1:]+[""]
-
-                iterTokens = 0
-                iterNextTokens = 0
-                while iterTokens < len(all_tokens) and iterNextTokens < len(following_tokens):
-                    token = all_tokens[iterTokens]
-                    next_token = following_tokens[iterNextTokens]
-                    if any(keyword in token for keyword in [VBNetParsingKeyword.NAMESPACE.value,
-                                                    VBNetParsingKeyword.CLASS.value,
-                                                    VBNetParsingKeyword.STRUCT.value,
-                                                    VBNetParsingKeyword.INTERFACE.value,
-                                                    VBNetParsingKeyword.ENUM.value,
-                                                    VBNetParsingKeyword.FUNCTION.value,
-                                                    VBNetParsingKeyword.SUB.value,
-                                                    VBNetParsingKeyword.IF.value]):
-                        scope_level += 1
-
-                    if token == close_scope_character and any(keyword in next_token for keyword in [VBNetParsingKeyword.NAMESPACE.value,
-                                                    VBNetParsingKeyword.CLASS.value,
-                                                    VBNetParsingKeyword.STRUCT.value,
-                                                    VBNetParsingKeyword.INTERFACE.value,
-                                                    VBNetParsingKeyword.ENUM.value,
-                                                    VBNetParsingKeyword.FUNCTION.value,
-                                                    VBNetParsingKeyword.SUB.value,
-                                                    VBNetParsingKeyword.IF.value]):
-                        scope_level -= 1
-                        if scope_level == 0:
-                            break
-                        iterTokens+=2
-                        iterNextTokens+=2
-
-                    if parsing_result.entity_name in found_entities:
-                        found_entities[parsing_result.entity_name].append(token)                       
-                    iterTokens+=1
-                    iterNextTokens+=1
+                # ParseResults resolves named results dynamically, so look the name up once instead of once per token
+                entity_name: str = parsing_result.entity_name
+                LOGGER.debug('entity definition found: %s', entity_name)
+                increment_statistics(parsing_hits)
+
+                found_entities[entity_name] = self.collect_scope_tokens(filtered_list_no_comments, index)
             previous_obj = obj
 
         for entity_name, tokens in found_entities.items():
@@ -398,7 +468,6 @@ class VBNetParser (AbstractParser, ParsingMixin):
         return created_entity_results
     
 
-
 if __name__ == "__main__":
     parser = VBNetParser()
     print(f'{parser.results=}')
\ No newline at end of file
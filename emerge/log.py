@@ -16,6 +16,9 @@ logging.addLevelName(logging.DEBUG, 'D')
 logging.addLevelName(logging.INFO, 'I')
 logging.addLevelName(logging.ERROR, 'E')
 
+# set once all loggers got their colored handlers installed by configure_once()
+_CONFIGURED = False
+
 
 @unique
 class LogLevel(Enum):
@@ -43,23 +46,23 @@ class Logger:
     def __init__(self, logger):
         self._logger = logger
 
-    def info(self, message: str):
-        self._logger.info("\U000023E9" + " " + message)
+    def info(self, message: str, *args):
+        self._logger.info("\U000023E9" + " " + message, *args)
 
-    def info_start(self, message: str):
-        self._logger.info("\U0001F449" + " " + message)
+    def info_start(self, message: str, *args):
+        self._logger.info("\U0001F449" + " " + message, *args)
 
-    def debug(self, message: str):
-        self._logger.debug("\U000023E9" + " " + message)
+    def debug(self, message: str, *args):
+        self._logger.debug("\U000023E9" + " " + message, *args)
 
-    def error(self, message: str):
-        self._logger.error("\U00002757" + " " + message)
+    def error(self, message: str, *args):
+        self._logger.error("\U00002757" + " " + message, *args)
 
-    def warning(self, message: str):
-        self._logger.debug("\U00002753" + " " + message)
+    def warning(self, message: str, *args):
+        self._logger.debug("\U00002753" + " " + message, *args)
 
-    def info_done(self, message: str):
-        self._logger.info("\U00002705" + " " + message)
+    def info_done(self, message: str, *args):
+        self._logger.info("\U00002705" + " " + message, *args)
 
     def logger(self):
         return self._logger
@@ -142,3 +145,14 @@ class Logger:
             Logger.level = LogLevel.ERROR
             new_logger = Logger(logging.getLogger(logger_name))
             coloredlogs.install(level='ERROR', logger=new_logger.logger(), fmt=Logger.log_format)
+
+
+def configure_once():
+    """Installs colored log handlers on all loggers at error level, only the first call has an effect.
+    """
+    global _CONFIGURED  # pylint: disable=global-statement
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+    for logger_name in ALL_LOGGERS:
+        coloredlogs.install(level='E', logger=logging.getLogger(logger_name), fmt=Logger.log_format)
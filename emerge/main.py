@@ -6,9 +6,11 @@ Allow emerge to be importable by a start script (e.g. installed by pip) as a sta
 # License: MIT
 
 from emerge.appear import Emerge
+from emerge.log import configure_once
 
 
 def run():
+    configure_once()
     emerge = Emerge()
     emerge.start()
 
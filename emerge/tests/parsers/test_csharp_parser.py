@@ -0,0 +1,131 @@
+"""
+All unit tests that are related to CSharpParser.
+"""
+
+# Authors: Henrique Gouveia <hgouveia@icloud.com>
+
+from typing import Dict
+import sys
+import unittest
+from unittest import mock
+
+from tests.testdata.csharp import CSHARP_TEST_FILES
+
+from emerge.languages.csharpparser import CSharpParser
+from emerge.results import FileResult, EntityResult
+from emerge.languages.abstractparser import LanguageType
+from emerge.analysis import Analysis
+
+
+class CSharpParserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.example_data = CSHARP_TEST_FILES
+        self.parser = CSharpParser()
+        self.analysis = Analysis()
+        self.analysis.analysis_name = "test"
+        self.analysis.source_directory = "/tests"
+
+    def tearDown(self):
+        pass
+
+    def test_generate_file_results(self):
+        """Generate file results for all parsers and check if metrics were calculated."""
+        self.assertFalse(self.parser.results)
+
+        for file_name, file_content in self.example_data.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+
+        self.parser.after_generated_file_results(self.analysis)
+
+        results: Dict[str, FileResult] = self.parser.results
+        self.assertTrue(results)
+        self.assertTrue(len(results) == 2)
+
+        result: FileResult
+        for _, result in results.items():
+            self.assertTrue(len(result.scanned_tokens) > 0)
+            self.assertTrue(len(result.scanned_import_dependencies) > 0)
+
+            self.assertTrue(result.analysis.analysis_name.strip())
+            self.assertTrue(result.scanned_file_name.strip())
+            self.assertTrue(result.scanned_by.strip())
+            self.assertTrue(result.scanned_language == LanguageType.CSHARP)
+
+        repository_result = next(x for x in results.values() if x.display_name == 'Repository.cs')
+        self.assertTrue(repository_result.scanned_import_dependencies ==
+                        ['System', 'System.Collections.Generic', 'System.Linq', 'MyCompany.Data.Contracts'])
+        self.assertTrue(repository_result.module_name == 'MyCompany.Data.Repositories')
+
+        service_result = next(x for x in results.values() if x.display_name == 'Service.cs')
+        self.assertTrue(service_result.module_name == 'MyCompany.Services')
+
+    def test_generate_file_results_in_parallel(self):
+        """Generate file results for a batch of files in worker processes and compare them to sequentially generated results."""
+        files = [(f'{i}{file_name}', f'/tests/{i}{file_name}', file_content)
+                 for i in range(8) for file_name, file_content in self.example_data.items()]
+
+        # force worker processes for this small batch, also on machines with a single CPU
+        with mock.patch('emerge.languages.abstractparser.MIN_CONTENT_SIZE_FOR_PARALLEL_PARSING', 0), \
+                mock.patch('os.cpu_count', return_value=2):
+            self.parser.generate_file_results_from_analysis(self.analysis, files)
+
+        sequential_parser = CSharpParser()
+        for file_name, full_file_path, file_content in files:
+            sequential_parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path=full_file_path,
+                                                                 file_content=file_content)
+
+        self.assertTrue(len(self.parser.results) == len(files))
+
+        result: FileResult
+        for unique_name, result in sequential_parser.results.items():
+            self.assertTrue(self.parser.results[unique_name].scanned_tokens == result.scanned_tokens)
+            self.assertTrue(self.parser.results[unique_name].module_name == result.module_name)
+
+        # tokens from worker processes are interned again, so that recurring tokens share one string object across all files
+        self.assertTrue(all(token is sys.intern(token) for result in self.parser.results.values() for token in result.scanned_tokens))
+
+    def test_generate_entity_results(self):
+        """Generate entity results and check basic attributes."""
+        self.assertFalse(self.parser.results)
+
+        for file_name, file_content in self.example_data.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+
+        results: Dict[str, EntityResult] = self.parser.results
+        self.assertTrue(results)
+        self.assertTrue(len(results) == 2)
+
+        self.parser.generate_entity_results_from_analysis(self.analysis)
+        self.analysis.collect_results_from_parser(self.parser)
+        entity_results = self.analysis.entity_results
+
+        self.assertTrue(len(entity_results) == 7)
+
+        result: EntityResult
+        for _, result in entity_results.items():
+            self.assertTrue(len(result.scanned_tokens) > 0)
+            self.assertTrue(len(result.scanned_import_dependencies) > 0)
+            self.assertTrue(result.analysis.analysis_name.strip())
+            self.assertTrue(result.entity_name.strip())
+            self.assertTrue(result.scanned_file_name.strip())
+            self.assertTrue(result.scanned_by.strip())
+            self.assertTrue(result.scanned_language == LanguageType.CSHARP)
+
+        self.assertTrue(entity_results['CustomerRepository'].scanned_inheritance_dependencies == ['RepositoryBase'])
+        self.assertTrue(entity_results['ICustomerService'].scanned_inheritance_dependencies == ['IDisposable'])
+        self.assertFalse(entity_results['CustomerKind'].scanned_inheritance_dependencies)
+
+    def test_clear_results(self):
+        """Clear all results and check that no entity results are generated from previously generated file results."""
+        for file_name, file_content in self.example_data.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+
+        self.parser.clear_results()
+        self.assertFalse(self.parser.results)
+
+        self.parser.generate_entity_results_from_analysis(self.analysis)
+        self.assertFalse(self.parser.results)
@@ -31,6 +31,24 @@ class ParsingMixinTestCase(unittest.TestCase):
         relative_analysis_path = ParsingMixin.create_relative_analysis_file_path(self.analysis.source_directory, full_file_path)
         self.assertTrue(relative_analysis_path == expected_relative_analysis_path)
 
+    def test_create_parent_analysis_source_path(self):
+        """Test creating the path prefix that is stripped from full file paths."""
+
+        parent_analysis_source_path = ParsingMixin.create_parent_analysis_source_path(self.analysis.source_directory)
+        self.assertTrue(parent_analysis_source_path == "/path/to/")
+
+    def test_preprocess_file_content_and_generate_token_list_by_mapping(self):
+        """Test generating tokens with single character mappings and with a mapping of more than one character."""
+
+        file_content = 'func f(a, b ...int) {\n\treturn a\n}'
+        mapping = {'(': ' ( ', ')': ' ) ', ',': ' , '}
+        tokens = ParsingMixin.preprocess_file_content_and_generate_token_list_by_mapping(file_content, mapping)
+        self.assertTrue(tokens == ['func', 'f', '(', 'a', ',', 'b', '...int', ')', '{', '\n', 'return', 'a', '\n', '}'])
+
+        mapping = {'(': ' ( ', ')': ' ) ', '...': ' ... '}
+        tokens = ParsingMixin.preprocess_file_content_and_generate_token_list_by_mapping(file_content, mapping)
+        self.assertTrue(tokens == ['func', 'f', '(', 'a,', 'b', '...', 'int', ')', '{', '\n', 'return', 'a', '\n', '}'])
+
     def test_create_relative_analysis_path_for_dependency(self):
         """Test creating a relative analysis path for a dependency name."""
 
@@ -0,0 +1,189 @@
+"""
+All unit tests that are related to VBNetParser.
+"""
+
+# Authors: Henrique Gouveia <hgouveia@icloud.com>
+
+from typing import Dict, List
+import sys
+import unittest
+from unittest import mock
+
+from tests.testdata.vbnet import VBNET_TEST_FILES
+
+from emerge.languages.vbnetparser import VBNetParser
+from emerge.results import FileResult, EntityResult
+from emerge.languages.abstractparser import LanguageType
+from emerge.analysis import Analysis
+
+
+class VBNetParserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.example_data = VBNET_TEST_FILES
+        self.parser = VBNetParser()
+        self.analysis = Analysis()
+        self.analysis.analysis_name = "test"
+        self.analysis.source_directory = "/tests"
+
+    def tearDown(self):
+        pass
+
+    def test_generate_file_results(self):
+        """Generate file results for all parsers and check if metrics were calculated."""
+        self.assertFalse(self.parser.results)
+
+        for file_name, file_content in self.example_data.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+
+        self.parser.after_generated_file_results(self.analysis)
+
+        results: Dict[str, FileResult] = self.parser.results
+        self.assertTrue(results)
+        self.assertTrue(len(results) == 2)
+
+        result: FileResult
+        for _, result in results.items():
+            self.assertTrue(len(result.scanned_tokens) > 0)
+            self.assertTrue(len(result.scanned_import_dependencies) > 0)
+
+            self.assertTrue(result.analysis.analysis_name.strip())
+            self.assertTrue(result.scanned_file_name.strip())
+            self.assertTrue(result.scanned_by.strip())
+            self.assertTrue(result.scanned_language == LanguageType.VBNET)
+            self.assertFalse(any(token.startswith("'") for token in result.scanned_tokens))
+
+        customer_result = next(x for x in results.values() if x.display_name == 'Customer.vb')
+        self.assertTrue(customer_result.scanned_import_dependencies == ['System', 'System.Collections.Generic', 'MyCompany.Data'])
+
+    def test_generate_file_results_in_parallel(self):
+        """Generate file results for a batch of files in worker processes and compare them to sequentially generated results."""
+        files = [(f'{i}{file_name}', f'/tests/{i}{file_name}', file_content)
+                 for i in range(8) for file_name, file_content in self.example_data.items()]
+
+        # force worker processes for this small batch, also on machines with a single CPU
+        with mock.patch('emerge.languages.abstractparser.MIN_CONTENT_SIZE_FOR_PARALLEL_PARSING', 0), \
+                mock.patch('os.cpu_count', return_value=2):
+            self.parser.generate_file_results_from_analysis(self.analysis, files)
+
+        sequential_parser = VBNetParser()
+        for file_name, full_file_path, file_content in files:
+            sequential_parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path=full_file_path,
+                                                                 file_content=file_content)
+
+        self.assertTrue(len(self.parser.results) == len(files))
+
+        result: FileResult
+        for unique_name, result in sequential_parser.results.items():
+            self.assertTrue(self.parser.results[unique_name].scanned_tokens == result.scanned_tokens)
+            self.assertTrue(self.parser.results[unique_name].scanned_file_name == result.scanned_file_name)
+
+        # tokens from worker processes are interned again, so that recurring tokens share one string object across all files
+        self.assertTrue(all(token is sys.intern(token) for result in self.parser.results.values() for token in result.scanned_tokens))
+
+    def test_generate_file_results_with_bom(self):
+        """Generate file results for files that start with a BOM, either decoded or read as ISO-8859-1.
+        Check that the BOM is removed.
+        """
+        file_content = self.example_data['Customer.vb']
+        for bom in ('\ufeff', '\u00ef\u00bb\u00bf'):
+            parser = VBNetParser()
+            parser.generate_file_result_from_analysis(self.analysis, file_name='Customer.vb', full_file_path='/tests/Customer.vb',
+                                                      file_content=bom + file_content)
+            parser.after_generated_file_results(self.analysis)
+
+            result: FileResult = next(iter(parser.results.values()))
+            self.assertTrue(result.source == file_content)
+            self.assertTrue(result.scanned_import_dependencies == ['System', 'System.Collections.Generic', 'MyCompany.Data'])
+
+    def test_generate_entity_results(self):
+        """Generate entity results and check basic attributes."""
+        self.assertFalse(self.parser.results)
+
+        for file_name, file_content in self.example_data.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+
+        results: Dict[str, EntityResult] = self.parser.results
+        self.assertTrue(results)
+        self.assertTrue(len(results) == 2)
+
+        self.parser.generate_entity_results_from_analysis(self.analysis)
+        self.analysis.collect_results_from_parser(self.parser)
+        entity_results = self.analysis.entity_results
+
+        self.assertTrue(len(entity_results) == 5)
+
+        result: EntityResult
+        for _, result in entity_results.items():
+            self.assertTrue(len(result.scanned_tokens) > 0)
+            self.assertTrue(len(result.scanned_import_dependencies) > 0)
+            self.assertTrue(result.analysis.analysis_name.strip())
+            self.assertTrue(result.entity_name.strip())
+            self.assertTrue(result.scanned_file_name.strip())
+            self.assertTrue(result.scanned_by.strip())
+            self.assertTrue(result.scanned_language == LanguageType.VBNET)
+
+        self.assertTrue(entity_results['Customer'].scanned_inheritance_dependencies == ['EntityBase'])
+        self.assertTrue(entity_results['Order'].scanned_inheritance_dependencies == ['EntityBase'])
+        self.assertFalse(entity_results['Money'].scanned_inheritance_dependencies)
+
+        # an entity scope ends with its matching 'End' keyword
+        self.assertTrue(entity_results['CustomerKind'].scanned_tokens == ['Enum', 'CustomerKind', '\n', 'Regular', '\n', 'Premium', '\n'])
+
+    def test_generate_entity_results_with_keyword_substrings(self):
+        """Generate entity results from tokens that only contain scope keywords, like 'Subtotal'.
+        Check that scopes and imports are still found.
+        """
+        file_content = """Imports MyCompany.Enumerations
+Imports System.Linq
+
+Public Class Invoice
+    Public Subtotal As Decimal
+End Class
+
+Public Class Payment
+End Class
+"""
+        self.parser.generate_file_result_from_analysis(self.analysis, file_name="Invoice.vb", full_file_path="/tests/Invoice.vb",
+                                                       file_content=file_content)
+        self.parser.generate_entity_results_from_analysis(self.analysis)
+
+        invoice_result: EntityResult = self.parser.results['Invoice']
+        self.assertTrue(invoice_result.scanned_import_dependencies == ['MyCompany.Enumerations', 'System.Linq'])
+        self.assertFalse('Payment' in invoice_result.scanned_tokens)
+
+    def test_generate_results_with_duplicate_imports(self):
+        """Generate results for a file that imports the same namespace twice and check that the import is only added once."""
+        file_content = "Imports System\nImports System\nImports System.Linq\n\nPublic Class Invoice\nEnd Class\n"
+        self.parser.generate_file_result_from_analysis(self.analysis, file_name="Invoice.vb", full_file_path="/tests/Invoice.vb",
+                                                       file_content=file_content)
+        self.parser.after_generated_file_results(self.analysis)
+
+        file_result = next(iter(self.parser.results.values()))
+        self.assertTrue(file_result.scanned_import_dependencies == ['System', 'System.Linq'])
+
+        self.parser.generate_entity_results_from_analysis(self.analysis)
+        self.assertTrue(self.parser.results['Invoice'].scanned_import_dependencies == ['System', 'System.Linq'])
+
+    def test_generate_file_results_ending_with_imports(self):
+        """Generate file results for files that end with an Imports keyword without a name and check that no import is added for it."""
+        file_contents: Dict[str, str] = {
+            'Partial.vb': "Imports System\nImports",
+            'Empty.vb': "Imports"
+        }
+        expected_import_dependencies: Dict[str, List[str]] = {
+            'Partial.vb': ['System'],
+            'Empty.vb': []
+        }
+
+        for file_name, file_content in file_contents.items():
+            self.parser.generate_file_result_from_analysis(self.analysis, file_name=file_name, full_file_path="/tests/" + file_name,
+                                                           file_content=file_content)
+        self.parser.after_generated_file_results(self.analysis)
+        self.assertTrue(len(self.parser.results) == len(file_contents))
+
+        result: FileResult
+        for result in self.parser.results.values():
+            self.assertTrue(result.scanned_import_dependencies == expected_import_dependencies[result.display_name])
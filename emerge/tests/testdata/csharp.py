@@ -0,0 +1,84 @@
+CSHARP_TEST_FILES = {"Repository.cs": """using System;
+using System.Collections.Generic;
+using System.Linq;
+using MyCompany.Data.Contracts;
+
+namespace MyCompany.Data.Repositories
+{
+    /// <summary>
+    /// Generic repository base class for entities.
+    /// </summary>
+    public abstract class RepositoryBase<T> : IRepository<T> where T : class
+    {
+        private readonly List<T> _items = new List<T>();
+
+        // add a new item { not a scope }
+        public virtual void Add(T item)
+        {
+            if (item == null)
+            {
+                throw new ArgumentNullException(nameof(item));
+            }
+            _items.Add(item);
+        }
+
+        public IEnumerable<T> All() { return _items.ToList(); }
+    }
+
+    public class CustomerRepository : RepositoryBase<Customer>, ICustomerRepository
+    {
+        /* block comment with class Foo {
+           spanning lines */
+        public Customer FindByName(string name)
+        {
+            return All().FirstOrDefault(c => c.Name == name);
+        }
+
+        private class CacheEntry
+        {
+            public DateTime Created { get; set; }
+        }
+    }
+
+    internal struct Point : IEquatable<Point>
+    {
+        public int X;
+        public int Y;
+        public bool Equals(Point other) { return X == other.X && Y == other.Y; }
+    }
+
+    public enum CustomerKind
+    {
+        Regular,
+        Premium
+    }
+}
+""", "Service.cs": """using System;
+using System.Threading.Tasks;
+using MyCompany.Data.Repositories;
+
+namespace MyCompany.Services;
+
+public interface ICustomerService : IDisposable
+{
+    Task<Customer> GetAsync(int id);
+}
+
+public sealed class CustomerService : ICustomerService
+{
+    private readonly CustomerRepository _repository;
+
+    public CustomerService(CustomerRepository repository)
+    {
+        _repository = repository;
+    }
+
+    public Task<Customer> GetAsync(int id)
+    {
+        var subclass = "class name";
+        return Task.FromResult(_repository.FindByName(id.ToString()));
+    }
+
+    public void Dispose() { }
+}
+"""}
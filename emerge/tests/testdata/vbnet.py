@@ -0,0 +1,60 @@
+VBNET_TEST_FILES = {"Customer.vb": """Imports System
+Imports System.Collections.Generic
+Imports MyCompany.Data
+
+Namespace MyCompany.Models
+
+    ' A customer entity
+    Public Class Customer
+        Inherits EntityBase
+
+#Region "Properties"
+        Public Property Name As String
+        Public Property Orders As List(Of Order)
+#End Region
+
+        Public Function GetTotal() As Decimal
+            Dim total As Decimal = 0
+            For Each o In Orders
+                If o.IsPaid Then
+                    total += o.Amount
+                End If
+            Next
+            Return total
+        End Function
+
+        Public Sub Reset()
+            Orders.Clear()
+        End Sub
+    End Class
+
+    Public Structure Money
+        Public Amount As Decimal
+        Public Currency As String
+    End Structure
+
+    Public Interface ICustomerService
+        Function GetCustomer(id As Integer) As Customer
+    End Interface
+
+    Public Enum CustomerKind
+        Regular
+        Premium
+    End Enum
+
+End Namespace
+""", "Order.vb": """Imports System
+
+Public Class Order
+    Inherits EntityBase
+    Implements IComparable
+
+    Public Property Amount As Decimal
+    Public Property IsPaid As Boolean
+
+    ' Compare by amount
+    Public Function CompareTo(obj As Object) As Integer Implements IComparable.CompareTo
+        Return Amount.CompareTo(CType(obj, Order).Amount)
+    End Function
+End Class
+"""}